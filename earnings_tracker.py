@@ -1,12 +1,580 @@
 import yfinance as yf
+from yfinance.data import YfData
+from yfinance import _http as yf_http
+import orjson
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+import requests
 import argparse
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sqlite3
+import sys
 import time
-import pytz
-from typing import List, Dict, Union, Optional
+import threading
+import functools
+import random
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, List, Dict, Literal, Tuple, Union, Optional
 
-def get_earnings_date(ticker_symbol: str) -> Dict[str, Union[str, None, datetime]]:
+logger = logging.getLogger('earniac')
+
+# Number of tickers fetched concurrently
+DEFAULT_WORKERS = 8
+
+# Seconds to wait for a single ticker before giving up on it
+FETCH_TIMEOUT = 60
+
+# Yahoo's quote endpoint returns earnings timestamps for many symbols at once
+QUOTE_URL = 'https://query1.finance.yahoo.com/v7/finance/quote'
+BATCH_SIZE = 20
+
+# Per-ticker lookups ask quoteSummary for just the modules they need, which is
+# a few KB instead of the full info payload
+QUOTE_SUMMARY_URL = 'https://query2.finance.yahoo.com/v10/finance/quoteSummary/{}'
+
+# Financial Modeling Prep's earnings calendar covers every company in one
+# request, which beats per-ticker lookups for large ticker lists
+FMP_CALENDAR_URL = 'https://financialmodelingprep.com/api/v3/earning_calendar'
+FMP_THRESHOLD = 100
+FMP_LOOKAHEAD_DAYS = 90
+
+# FMP only gives the date and whether a company reports before market open
+# or after the close, so that is shown in place of a time of day
+FMP_REPORT_TIMES = {'bmo': 'Before market open', 'amc': 'After market close'}
+
+# All dates are reported in Eastern Time
+EASTERN = ZoneInfo('America/New_York')
+
+# ISO date, the month and year for the date in words, and time of day,
+# separated by '|' so one strftime call produces all three
+DATE_FORMATS = '%Y-%m-%d| %B, %Y|%H:%M:%S %Z'
+
+# Ordinal suffix for each day of the month, indexed by day
+ORDINAL_SUFFIX = ['th'] * 32
+ORDINAL_SUFFIX[1] = ORDINAL_SUFFIX[21] = ORDINAL_SUFFIX[31] = 'st'
+ORDINAL_SUFFIX[2] = ORDINAL_SUFFIX[22] = 'nd'
+ORDINAL_SUFFIX[3] = ORDINAL_SUFFIX[23] = 'rd'
+
+# On-disk cache of earnings results between runs
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.earniac', 'cache.sqlite')
+
+# Cached dates are refreshed daily, since companies confirm or move their
+# dates in the run-up to reporting
+CACHE_TTL = 24 * 60 * 60
+
+class EarningsCache:
+    """
+    SQLite-backed cache of earnings results keyed by ticker.
+    
+    Args:
+        path: Path of the SQLite database file
+    """
+    def __init__(self, path: str = CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS earnings '
+            '(ticker TEXT PRIMARY KEY, result TEXT NOT NULL, expires REAL NOT NULL)'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS failures '
+            '(ticker TEXT PRIMARY KEY, count INTEGER NOT NULL, opened_at REAL)'
+        )
+    
+    def get(self, ticker: str) -> Optional[Dict[str, Union[str, int, None]]]:
+        """Return the cached result for a ticker, or None if missing or expired."""
+        row = self.conn.execute(
+            'SELECT result, expires FROM earnings WHERE ticker = ?', (ticker,)
+        ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+    
+    def set(self, ticker: str, result: Dict[str, Union[str, int, None]]) -> None:
+        """Cache a result that has an earnings timestamp."""
+        earnings_timestamp = result['timestamp']
+        
+        # Don't keep serving a date once it has passed, the next one may be out
+        expires = time.time() + CACHE_TTL
+        if earnings_timestamp > time.time():
+            expires = min(expires, earnings_timestamp)
+        
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO earnings (ticker, result, expires) VALUES (?, ?, ?)',
+                (ticker, json.dumps(result), expires)
+            )
+    
+    def get_failures(self) -> Dict[str, Tuple[int, Optional[float]]]:
+        """Return the failure count and circuit open time saved for each ticker."""
+        rows = self.conn.execute('SELECT ticker, count, opened_at FROM failures')
+        return {ticker: (count, opened_at) for ticker, count, opened_at in rows}
+    
+    def set_failures(self, failures: Dict[str, Tuple[int, Optional[float]]]) -> None:
+        """Replace the saved failure counts and circuit open times."""
+        with self.conn:
+            self.conn.execute('DELETE FROM failures')
+            self.conn.executemany(
+                'INSERT INTO failures (ticker, count, opened_at) VALUES (?, ?, ?)',
+                [(ticker, count, opened_at) for ticker, (count, opened_at) in failures.items()]
+            )
+    
+    def close(self) -> None:
+        self.conn.close()
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often Yahoo Finance is hit.
+    
+    Args:
+        rate: Number of requests allowed per period
+        per: Length of the period in seconds
+    """
+    def __init__(self, rate: int, per: float = 1.0):
+        self.capacity = rate
+        self.fill_rate = rate / per
+        self.tokens = float(rate)
+        self.last = time.monotonic()
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.resume_at:
+                    wait = self.resume_at - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.fill_rate)
+                    self.last = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for the given number of seconds."""
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+            self.tokens = 0.0
+            self.last = self.resume_at
+
+# Shared limiter for every request made by the worker threads
+LIMITER = RateLimiter(rate=4, per=1.0)
+
+class ThrottledSession(yf_http.requests.Session):
+    """
+    yfinance's default session, taking a LIMITER token for every request.
+    
+    Like the session yfinance would create itself, this is a curl_cffi
+    session impersonating Chrome, or a requests session with browser headers
+    when curl_cffi isn't available; Yahoo tends to block anything else.
+    Throttling covers the extra requests yfinance makes internally (cookie,
+    crumb and retries) as well as our own. A 429 response pauses the limiter
+    for every thread, for as long as its Retry-After header asks.
+    """
+    def __init__(self):
+        if yf_http.HAS_CURL_CFFI:
+            super().__init__(impersonate='chrome')
+        else:
+            super().__init__()
+            self.headers.update(yf_http.new_session().headers)
+    
+    def request(self, *args, **kwargs) -> yf_http.requests.Response:
+        LIMITER.acquire()
+        response = super().request(*args, **kwargs)
+        if response.status_code == 429:
+            retry_after = get_retry_after(response)
+            if retry_after:
+                LIMITER.pause(retry_after)
+        return response
+
+# One shared session so connections (and their TLS handshakes) are reused
+# across tickers and worker threads. It never retries by itself: rate_limited
+# is the one retry layer, so every attempt goes through the limiter.
+SESSION = ThrottledSession()
+
+# FMP has nothing to do with Yahoo's rate limits, so it gets its own plain
+# session instead of going through the limiter
+FMP_SESSION = requests.Session()
+
+# Longest wait in seconds before retrying a request that failed transiently
+MAX_TRANSIENT_DELAY = 8
+
+class CircuitBreaker:
+    """
+    Thread-safe per-ticker circuit breaker.
+    
+    After `failure_threshold` consecutive failures for a ticker, the circuit
+    opens and the ticker is skipped until `recovery_timeout` seconds have
+    passed. The next attempt after that either closes the circuit again or
+    reopens it. Times are wall-clock so the state can be saved between runs.
+    
+    Args:
+        failure_threshold: Consecutive failures before the circuit opens
+        recovery_timeout: Seconds to skip a ticker once its circuit is open
+    """
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = {}
+        self.opened_at = {}
+        self.lock = threading.Lock()
+    
+    def allow(self, key: str) -> bool:
+        """Check whether a request for the key may go ahead."""
+        with self.lock:
+            opened_at = self.opened_at.get(key)
+            return opened_at is None or time.time() - opened_at >= self.recovery_timeout
+    
+    def record_success(self, key: str) -> None:
+        """Close the circuit for the key."""
+        with self.lock:
+            self.failures.pop(key, None)
+            self.opened_at.pop(key, None)
+    
+    def record_failure(self, key: str) -> None:
+        """Count a failure for the key, opening its circuit at the threshold."""
+        with self.lock:
+            self.failures[key] = self.failures.get(key, 0) + 1
+            if self.failures[key] >= self.failure_threshold:
+                self.opened_at[key] = time.time()
+    
+    def state(self) -> Dict[str, Tuple[int, Optional[float]]]:
+        """Return the failure count and open time of every key with failures."""
+        with self.lock:
+            return {key: (count, self.opened_at.get(key)) for key, count in self.failures.items()}
+    
+    def load(self, state: Dict[str, Tuple[int, Optional[float]]]) -> None:
+        """Replace the current state with one returned by state()."""
+        with self.lock:
+            self.failures = {key: count for key, (count, _) in state.items()}
+            self.opened_at = {key: opened_at for key, (_, opened_at) in state.items()
+                              if opened_at is not None}
+
+# Seconds to skip a ticker Yahoo keeps saying doesn't exist
+CIRCUIT_RECOVERY_TIMEOUT = 5 * 60
+
+# Unknown tickers (e.g. delisted symbols) are skipped for a while instead of
+# costing a full round of requests on every lookup. Its state is kept in the
+# cache between runs; without a cache it only lasts as long as the process.
+CIRCUIT = CircuitBreaker(failure_threshold=2, recovery_timeout=CIRCUIT_RECOVERY_TIMEOUT)
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether an exception was caused by an HTTP 429 from Yahoo."""
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+    # yfinance raises its own error type for 429s, so fall back to the message
+    return 'Too Many Requests' in str(error)
+
+# Error types of both HTTP backends: requests, and curl_cffi, which SESSION
+# uses when it's available
+NETWORK_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                  yf_http.requests.exceptions.ConnectionError, yf_http.requests.exceptions.Timeout,
+                  TimeoutError)
+HTTP_ERRORS = (requests.exceptions.HTTPError, yf_http.HTTPError)
+
+def is_transient(error: Exception) -> bool:
+    """Check whether an exception looks like a temporary network or server problem."""
+    if isinstance(error, NETWORK_ERRORS):
+        return True
+    response = getattr(error, 'response', None)
+    return isinstance(error, HTTP_ERRORS) and getattr(response, 'status_code', 0) >= 500
+
+def is_unknown_symbol(error: Exception) -> bool:
+    """Check whether an exception means Yahoo has no such symbol."""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) == 404 or 'Not Found' in str(error)
+
+def get_retry_after(response: Any) -> Optional[float]:
+    """Get the delay in seconds from a response's Retry-After header, if any."""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def rate_limited(max_attempts: int = 4, base_delay: float = 1.0) -> Callable:
+    """
+    Decorator retrying a Yahoo request that was rate limited or failed.
+    
+    Every request is already throttled by SESSION. When Yahoo rate limits us,
+    the limiter is paused for every thread (for at least as long as a
+    Retry-After header asks, if there is one) and the call is retried with
+    exponential backoff. Transient network and server errors
+    are retried with a shorter backoff, capped at MAX_TRANSIENT_DELAY.
+    
+    Args:
+        max_attempts: Total number of attempts before giving up
+        base_delay: Delay in seconds before the first retry, doubled on each retry
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts - 1:
+                        raise
+                    if is_rate_limited(e):
+                        # Add jitter so worker threads don't retry in lockstep
+                        delay = base_delay * 2 ** attempt * (1 + random.random())
+                        delay = max(delay, get_retry_after(getattr(e, 'response', None)) or 0)
+                        logger.info("  Rate limited, retrying in %.1fs", delay)
+                        LIMITER.pause(delay)
+                    elif is_transient(e):
+                        delay = min(base_delay / 2 * 2 ** attempt, MAX_TRANSIENT_DELAY)
+                        logger.info("  Request failed (%s), retrying in %.1fs", e, delay)
+                        time.sleep(delay)
+                    else:
+                        raise
+        return wrapper
+    return decorator
+
+def _yahoo_json(url: str, params: Dict[str, str]) -> Any:
+    """
+    Make a Yahoo Finance API request through SESSION and parse the JSON body.
+    
+    Args:
+        url: Yahoo Finance API endpoint
+        params: Query parameters for the request
+    
+    Returns:
+        Parsed JSON response
+    """
+    # YfData takes care of the cookie and crumb Yahoo requires
+    response = YfData(session=SESSION).get(url, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@rate_limited()
+def fetch_quote_summary(ticker: str, modules: List[str]) -> Dict[str, Any]:
+    """
+    Fetch only the requested quoteSummary modules for a ticker.
+    
+    Args:
+        ticker: Normalized ticker symbol
+        modules: quoteSummary modules to request (e.g. 'calendarEvents')
+    
+    Returns:
+        Dictionary mapping each module returned to its data
+    """
+    data = _yahoo_json(QUOTE_SUMMARY_URL.format(ticker), {'modules': ','.join(modules)})['quoteSummary']
+    if data.get('error'):
+        raise LookupError(f"{data['error'].get('code')}: {data['error'].get('description')}")
+    return data['result'][0]
+
+# Ticker objects and quote summaries are memoized so repeated lookups of the
+# same symbol don't hit Yahoo again; call get_quote_summary.cache_clear() to
+# force fresh data.
+@functools.lru_cache(maxsize=128)
+def get_ticker(ticker: str) -> yf.Ticker:
+    """Get a (cached) yfinance Ticker object for a normalized symbol."""
+    return yf.Ticker(ticker, session=SESSION)
+
+@functools.lru_cache(maxsize=128)
+def get_quote_summary(ticker: str) -> Dict[str, Any]:
+    """Get the (cached) earnings and price modules for a normalized symbol."""
+    return fetch_quote_summary(ticker, ['calendarEvents', 'earnings', 'price'])
+
+@rate_limited()
+def fetch_ticker_data(ticker_obj: yf.Ticker, attribute: str) -> Any:
+    """Read a yfinance Ticker property that makes a request, e.g. 'calendar'."""
+    return getattr(ticker_obj, attribute)
+
+def batched(items: List[str], size: int):
+    """Yield successive chunks of at most `size` items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+@rate_limited()
+def fetch_batch(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch quote data for a batch of tickers in a single request.
+    
+    Args:
+        tickers: Normalized ticker symbols (at most BATCH_SIZE)
+    
+    Returns:
+        Dictionary mapping each ticker found to its quote dictionary
+    """
+    data = _yahoo_json(QUOTE_URL, {'symbols': ','.join(tickers)})
+    return {quote['symbol']: quote for quote in data['quoteResponse']['result']}
+
+def fetch_fmp_calendar(tickers: List[str],
+                       api_key: str) -> Dict[str, Dict[str, Union[str, int, None]]]:
+    """
+    Look up upcoming earnings dates from Financial Modeling Prep's calendar.
+    
+    The whole calendar for the next FMP_LOOKAHEAD_DAYS days comes back in a
+    single request and is filtered down to the requested tickers.
+    
+    Args:
+        tickers: Normalized ticker symbols
+        api_key: Financial Modeling Prep API key
+    
+    Returns:
+        Dictionary mapping each ticker found to its earnings result
+    """
+    today = date.today()
+    response = FMP_SESSION.get(FMP_CALENDAR_URL, params={
+        'from': today.isoformat(),
+        'to': (today + timedelta(days=FMP_LOOKAHEAD_DAYS)).isoformat(),
+        'apikey': api_key
+    }, timeout=FETCH_TIMEOUT)
+    response.raise_for_status()
+    
+    wanted = set(tickers)
+    found = {}
+    for entry in orjson.loads(response.content):
+        ticker = entry.get('symbol')
+        if ticker not in wanted:
+            continue
+        
+        # Only the date is known, so the timestamp is midnight Eastern
+        earnings_date = datetime.combine(date.fromisoformat(entry['date']), dt_time(0, 0), tzinfo=EASTERN)
+        timestamp = int(earnings_date.timestamp())
+        report_time = FMP_REPORT_TIMES.get(entry.get('time'), '')
+        
+        # Keep the soonest date if a company is listed more than once
+        if ticker not in found or timestamp < found[ticker]['timestamp']:
+            found[ticker] = make_result(ticker, ticker, timestamp, report_time)
+    return found
+
+def format_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add Eastern Time date and time columns computed from raw timestamps.
+    
+    Args:
+        df: DataFrame of results with 'timestamp' (epoch seconds) and
+            'report_time' columns
+    
+    Returns:
+        DataFrame with 'date_iso', 'date', 'time' and 'datetime' columns in
+        place of 'timestamp' and 'report_time'
+    """
+    earnings_dates = pd.to_datetime(df['timestamp'], unit='s', utc=True).dt.tz_convert(EASTERN)
+    
+    # Format everything in a single strftime pass and split the pieces apart
+    parts = earnings_dates.dt.strftime(DATE_FORMATS).str.split('|', expand=True)
+    parts = parts.reindex(columns=range(3))
+    
+    # Format date in words with ordinal suffix
+    days = earnings_dates.dt.day
+    date_words = days.astype('Int64').astype(str) + days.map(pd.Series(ORDINAL_SUFFIX)) + parts[1]
+    
+    # Rows with only a date show their report time label, if any, instead of
+    # a time of day, and have no exact datetime
+    date_only = df['report_time'].notna()
+    labels = df['report_time'].where(df['report_time'] != '')
+    
+    df = df.drop(columns=['timestamp', 'report_time'])
+    df['date_iso'] = parts[0]
+    df['date'] = date_words
+    df['time'] = parts[2].mask(date_only, labels)
+    df['datetime'] = earnings_dates.mask(date_only)
+    return df
+
+def make_result(ticker: str, company_name: str, timestamp: Optional[int] = None,
+                report_time: Optional[str] = None) -> Dict[str, Union[str, int, None]]:
+    """
+    Build the result dictionary for a ticker.
+    
+    Args:
+        ticker: Ticker symbol
+        company_name: Company name to report
+        timestamp: Earnings date as epoch seconds, or None if not found
+        report_time: Label shown instead of the time of day when only the
+            date is known (e.g. 'After market close', or '' if unknown);
+            None when the timestamp has an exact time
+    
+    Returns:
+        Dictionary with company info and earnings timestamp
+    """
+    return {
+        'ticker': ticker,
+        'company': company_name,
+        'timestamp': timestamp,
+        'report_time': report_time
+    }
+
+def to_timestamp(raw: Any) -> Optional[int]:
+    """
+    Normalize an earnings date from Yahoo Finance to epoch seconds.
+    
+    Args:
+        raw: Epoch seconds, pandas Timestamp or datetime (naive values are
+            treated as UTC)
+    
+    Returns:
+        Epoch seconds, or None if the value isn't a usable date
+    """
+    if isinstance(raw, (int, float)) and not pd.isna(raw):
+        return int(raw)
+    # pd.Timestamp is a datetime subclass, so this covers both
+    if isinstance(raw, datetime) and not pd.isna(raw):
+        if raw.tzinfo is None:
+            raw = raw.replace(tzinfo=timezone.utc)
+        return int(raw.timestamp())
+    return None
+
+def earnings_from_quote(ticker: str, company_name: str,
+                        quote: Dict[str, Any]) -> Optional[Dict[str, Union[str, int, None]]]:
+    """
+    Build an earnings result from a Yahoo quote dictionary.
+    
+    Args:
+        ticker: Normalized ticker symbol
+        company_name: Company name to report
+        quote: Quote dictionary returned by Yahoo Finance
+    
+    Returns:
+        Dictionary with company info and earnings timestamp, or None if the
+        quote has no earnings timestamp
+    """
+    # Try different timestamp fields that might contain earnings info
+    # Yahoo Finance API sometimes changes field names or structures
+    earnings_timestamp = None
+    
+    # Check all possible fields where earnings date might be stored
+    possible_fields = [
+        'earningsTimestamp', 
+        'nextEarningsDate',
+        'mostRecentQuarter',
+        'lastFiscalYearEnd'
+    ]
+    
+    for field in possible_fields:
+        if field in quote and quote[field]:
+            earnings_timestamp = quote[field]
+            logger.info("  Found earnings date in '%s' for %s", field, ticker)
+            break
+    
+    if earnings_timestamp:
+
+        current_timestamp = int(time.time())
+        if earnings_timestamp < current_timestamp:
+            # Try with earningsTimestampStart
+            earnings_timestamp_start = quote.get('earningsTimestampStart')
+            if earnings_timestamp_start and earnings_timestamp_start > current_timestamp:
+                earnings_timestamp = earnings_timestamp_start
+
+        return make_result(ticker, company_name, to_timestamp(earnings_timestamp))
+    
+    return None
+
+def get_earnings_date(ticker_symbol: str) -> Dict[str, Union[str, int, None]]:
     """
     Get the most recent or upcoming earnings date for a company ticker.
     
@@ -14,228 +582,223 @@ def get_earnings_date(ticker_symbol: str) -> Dict[str, Union[str, None, datetime
         ticker_symbol: Company ticker symbol
     
     Returns:
-        Dictionary with company info and earnings date
+        Dictionary with company info and earnings timestamp (epoch seconds)
     """
     try:
         # Clean and normalize ticker
         ticker = ticker_symbol.strip().upper()
         
-        # Get ticker object
-        ticker_obj = yf.Ticker(ticker)
-        
-        # Get company info
-        info = ticker_obj.info
-        company_name = info.get('shortName', ticker)
-        
-        # Try different timestamp fields that might contain earnings info
-        # Yahoo Finance API sometimes changes field names or structures
-        earnings_timestamp = None
-        
-        # Check all possible fields where earnings date might be stored
-        possible_fields = [
-            'earningsTimestamp', 
-            'nextEarningsDate',
-            'mostRecentQuarter',
-            'lastFiscalYearEnd'
-        ]
-        
-        for field in possible_fields:
-            if field in info and info[field]:
-                earnings_timestamp = info[field]
-                print(f"  Found earnings date in '{field}' for {ticker}")
-                break
+        if not CIRCUIT.allow(ticker):
+            logger.info("  Note: Skipping %s after repeated failures", ticker)
+            return make_result(ticker, ticker)
         
-        # Convert timestamp to datetime if found
-        if earnings_timestamp:
-
-            current_timestamp = int(time.time())
-            if earnings_timestamp < current_timestamp:
-                # Try with earningsTimestampStart
-                earnings_timestamp_start = info['earningsTimestampStart']
-                if earnings_timestamp_start > current_timestamp:
-                        earnings_timestamp = earnings_timestamp_start
-
-            # Convert to UTC datetime first
-            utc_dt = datetime.fromtimestamp(earnings_timestamp, tz=pytz.UTC)
-            
-            # Convert to Eastern Time
-            eastern = pytz.timezone('US/Eastern')
-            earnings_date = utc_dt.astimezone(eastern)
-            
-            # Format date in ISO format and words
-            date_str_iso = earnings_date.strftime('%Y-%m-%d')
-            
-            # Format date in words with ordinal suffix
-            day = earnings_date.day
-            if 4 <= day <= 20 or 24 <= day <= 30:
-                suffix = "th"
-            else:
-                suffix = ["st", "nd", "rd"][day % 10 - 1] if day % 10 <= 3 else "th"
-                
-            date_str_words = f"{day}{suffix} {earnings_date.strftime('%B')}, {earnings_date.year}"
-            time_str = earnings_date.strftime('%H:%M:%S %Z')
-            
-            return {
-                'ticker': ticker,
-                'company': company_name,
-                'date_iso': date_str_iso,
-                'date': date_str_words,
-                'time': time_str,
-                'datetime': earnings_date
-            }
-        
-        # If no timestamp found, try the calendar method
+        # One request brings back every source of earnings dates we use
         try:
-            calendar = ticker_obj.calendar
-            
-            # Check if calendar is a DataFrame and has data
-            if isinstance(calendar, pd.DataFrame) and not calendar.empty and 'Earnings Date' in calendar.index:
-                earnings_date_raw = calendar.loc['Earnings Date'].iloc[0]
-                
-                if isinstance(earnings_date_raw, pd.Timestamp):
-                    # Convert naive datetime to UTC first if it doesn't have timezone info
-                    if earnings_date_raw.tzinfo is None:
-                        earnings_date_utc = pytz.UTC.localize(earnings_date_raw)
-                    else:
-                        earnings_date_utc = earnings_date_raw.astimezone(pytz.UTC)
-                    
-                    # Convert to Eastern Time
-                    eastern = pytz.timezone('US/Eastern')
-                    earnings_date = earnings_date_utc.astimezone(eastern)
-                    
-                    # Format date in ISO format and words
-                    date_str_iso = earnings_date.strftime('%Y-%m-%d')
-                    
-                    # Format date in words with ordinal suffix
-                    day = earnings_date.day
-                    if 4 <= day <= 20 or 24 <= day <= 30:
-                        suffix = "th"
-                    else:
-                        suffix = ["st", "nd", "rd"][day % 10 - 1] if day % 10 <= 3 else "th"
-                        
-                    date_str_words = f"{day}{suffix} {earnings_date.strftime('%B')}, {earnings_date.year}"
-                    time_str = earnings_date.strftime('%H:%M:%S %Z')
-                    
-                    return {
-                        'ticker': ticker,
-                        'company': company_name,
-                        'date_iso': date_str_iso,
-                        'date': date_str_words,
-                        'time': time_str,
-                        'datetime': earnings_date
-                    }
+            summary = get_quote_summary(ticker)
         except Exception as e:
-            print(f"  Note: Could not get calendar data for {ticker}: {str(e)}")
+            # Only count Yahoo saying the symbol doesn't exist; other errors
+            # (rate limits, outages, crumb trouble) say nothing about the ticker
+            if is_unknown_symbol(e):
+                CIRCUIT.record_failure(ticker)
+            logger.info("  Note: Could not get quote summary for %s: %s", ticker, e)
+            return get_earnings_history_date(ticker)
+        CIRCUIT.record_success(ticker)
         
-        # Try earnings history as a last resort
-        try:
-            earnings_dates = ticker_obj.earnings_dates
-            
-            if isinstance(earnings_dates, pd.DataFrame) and not earnings_dates.empty:
-                # Get the most recent earnings date from history
-                latest_earnings = earnings_dates.iloc[0]
-                earnings_date_raw = latest_earnings.name
-                
-                if isinstance(earnings_date_raw, pd.Timestamp):
-                    # Convert naive datetime to UTC first if it doesn't have timezone info
-                    if earnings_date_raw.tzinfo is None:
-                        earnings_date_utc = pytz.UTC.localize(earnings_date_raw)
-                    else:
-                        earnings_date_utc = earnings_date_raw.astimezone(pytz.UTC)
-                    
-                    # Convert to Eastern Time
-                    eastern = pytz.timezone('US/Eastern')
-                    earnings_date = earnings_date_utc.astimezone(eastern)
-                    
-                    # Format date in ISO format and words
-                    date_str_iso = earnings_date.strftime('%Y-%m-%d')
-                    
-                    # Format date in words with ordinal suffix
-                    day = earnings_date.day
-                    if 4 <= day <= 20 or 24 <= day <= 30:
-                        suffix = "th"
-                    else:
-                        suffix = ["st", "nd", "rd"][day % 10 - 1] if day % 10 <= 3 else "th"
-                        
-                    date_str_words = f"{day}{suffix} {earnings_date.strftime('%B')}, {earnings_date.year}"
-                    time_str = earnings_date.strftime('%H:%M:%S %Z')
-                    
-                    return {
-                        'ticker': ticker,
-                        'company': company_name,
-                        'date_iso': date_str_iso,
-                        'date': date_str_words,
-                        'time': time_str,
-                        'datetime': earnings_date
-                    }
-        except Exception as e:
-            print(f"  Note: Could not get earnings_dates for {ticker}: {str(e)}")
+        company_name = summary.get('price', {}).get('shortName') or ticker
+        
+        # The earnings calendar has the upcoming date; the earnings chart
+        # usually has it too when the calendar is empty
+        candidates = [
+            ('calendarEvents', summary.get('calendarEvents', {}).get('earnings', {})),
+            ('earnings', summary.get('earnings', {}).get('earningsChart', {}))
+        ]
+        for module, data in candidates:
+            earnings_dates_raw = data.get('earningsDate', [])
+            if earnings_dates_raw:
+                timestamp = to_timestamp(earnings_dates_raw[0].get('raw'))
+                if timestamp:
+                    logger.info("  Found earnings date in '%s' for %s", module, ticker)
+                    return make_result(ticker, company_name, timestamp)
         
         # If we get here, we couldn't find an earnings date
-        print(f"  Warning: No earnings date found for {ticker}")
-        return {
-            'ticker': ticker,
-            'company': company_name,
-            'date_iso': None,
-            'date': None,
-            'time': None,
-            'datetime': None
-        }
+        logger.warning("  Warning: No earnings date found for %s", ticker)
+        return make_result(ticker, company_name)
         
     except Exception as e:
-        print(f"Error processing {ticker_symbol}: {str(e)}")
-        return {
-            'ticker': ticker_symbol,
-            'company': ticker_symbol,
-            'date': None,
-            'time': None,
-            'datetime': None
-        }
+        logger.error("Error processing %s: %s", ticker_symbol, e)
+        return make_result(ticker_symbol, ticker_symbol)
 
-def process_companies(company_list: List[str]) -> pd.DataFrame:
+def get_earnings_history_date(ticker: str) -> Dict[str, Union[str, int, None]]:
+    """
+    Get the most recent earnings date from a ticker's earnings history.
+    
+    This is a separate, slower request, only used when the quote summary
+    can't be fetched.
+    
+    Args:
+        ticker: Normalized ticker symbol
+    
+    Returns:
+        Dictionary with company info and earnings timestamp (epoch seconds)
+    """
+    try:
+        earnings_dates = fetch_ticker_data(get_ticker(ticker), 'earnings_dates')
+        
+        if isinstance(earnings_dates, pd.DataFrame) and not earnings_dates.empty:
+            # Get the most recent earnings date from history
+            timestamp = to_timestamp(earnings_dates.index[0])
+            if timestamp:
+                return make_result(ticker, ticker, timestamp)
+    except Exception as e:
+        logger.info("  Note: Could not get earnings_dates for %s: %s", ticker, e)
+    
+    logger.warning("  Warning: No earnings date found for %s", ticker)
+    return make_result(ticker, ticker)
+
+def process_companies(company_list: List[str], max_workers: int = DEFAULT_WORKERS,
+                      timeout: float = FETCH_TIMEOUT,
+                      cache: Optional[EarningsCache] = None,
+                      backend: Literal['yahoo', 'fmp'] = 'yahoo',
+                      fmp_api_key: Optional[str] = None) -> pd.DataFrame:
     """
     Process a list of company tickers and get their earnings dates.
     
+    Tickers are first looked up in batches through Yahoo's quote endpoint;
+    any without a date there fall back to a per-ticker lookup. Requests run
+    concurrently on a thread pool, each one throttled by a shared rate limiter.
+    With the 'fmp' backend, Financial Modeling Prep's earnings calendar is
+    tried first and Yahoo is only used for tickers it doesn't cover.
+    
     Args:
         company_list: List of company tickers
+        max_workers: Number of tickers to fetch concurrently
+        timeout: Seconds to wait for each ticker before skipping it
+        cache: Optional cache of results and failing tickers from previous runs
+        backend: Data source to try first, 'yahoo' or 'fmp'
+        fmp_api_key: Financial Modeling Prep API key, needed for the 'fmp' backend
     
     Returns:
         DataFrame with earnings information sorted by date and time
     """
-    results = []
+    logger.info("Processing %d companies...", len(company_list))
     
-    print(f"Processing {len(company_list)} companies...")
-    for i, company in enumerate(company_list):
-        print(f"[{i+1}/{len(company_list)}] Getting data for {company}")
-        result = get_earnings_date(company)
-        results.append(result)
-        # Add a short delay to avoid hitting rate limits
-        time.sleep(1)
+    def fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        try:
+            quotes = fetch_batch([company.strip().upper() for company in chunk])
+        except Exception as e:
+            logger.info("  Note: Could not get batch quote data: %s", e)
+            return {}
+        return {company: quotes[company.strip().upper()]
+                for company in chunk if company.strip().upper() in quotes}
+    
+    unique_companies = list(dict.fromkeys(company_list))
+    results_by_ticker = {}
+    
+    # Serve what we can from the cache and only fetch the rest
+    if cache is not None:
+        for company in unique_companies:
+            cached = cache.get(company.strip().upper())
+            if cached:
+                results_by_ticker[company] = cached
+        logger.info("Found %d earnings dates in cache", len(results_by_ticker))
+        CIRCUIT.load(cache.get_failures())
+    to_fetch = [company for company in unique_companies if company not in results_by_ticker]
+    
+    if backend == 'fmp':
+        try:
+            calendar = fetch_fmp_calendar([company.strip().upper() for company in to_fetch], fmp_api_key)
+        except Exception as e:
+            # Only log the status or error type: the request URL carries the API key
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            logger.info("  Note: Could not get FMP earnings calendar (%s), using Yahoo",
+                        f"HTTP {status}" if status else type(e).__name__)
+            calendar = {}
+        for company in to_fetch:
+            result = calendar.get(company.strip().upper())
+            if result:
+                results_by_ticker[company] = result
+        logger.info("Found %d earnings dates in FMP earnings calendar", len(calendar))
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        # Look tickers up in batches first, one request per BATCH_SIZE tickers.
+        # This also covers tickers found in the FMP calendar, which doesn't
+        # give company names.
+        batch_futures = [
+            executor.submit(fetch_chunk, chunk)
+            for chunk in batched(to_fetch, BATCH_SIZE)
+        ]
+        batch_found = 0
+        for future in batch_futures:
+            try:
+                quotes = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                logger.info("  Note: Timed out getting batch quote data")
+                continue
+            for company, quote in quotes.items():
+                ticker = company.strip().upper()
+                # A malformed quote only sends its ticker to the per-ticker lookup
+                try:
+                    company_name = quote.get('shortName') or ticker
+                    if company in results_by_ticker:
+                        results_by_ticker[company]['company'] = company_name
+                        continue
+                    result = earnings_from_quote(ticker, company_name, quote)
+                except Exception as e:
+                    logger.info("  Note: Could not read batch quote for %s: %s", ticker, e)
+                    continue
+                if result:
+                    results_by_ticker[company] = result
+                    batch_found += 1
+        logger.info("Found %d earnings dates in batch quotes", batch_found)
+        
+        # Fall back to the slower per-ticker lookup for anything the quote
+        # endpoint had no date for, keyed on the ticker so results can be put
+        # back in input order
+        futures = {
+            company: executor.submit(get_earnings_date, company)
+            for company in to_fetch
+            if company not in results_by_ticker
+        }
+        
+        total = len(futures)
+        for i, (company, future) in enumerate(futures.items(), 1):
+            try:
+                results_by_ticker[company] = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                logger.warning("  Warning: Timed out getting data for %s", company)
+                results_by_ticker[company] = make_result(company, company)
+            logger.info("[%d/%d] Got data for %s", i, total, company)
+    finally:
+        # Return the results we already have without waiting on a stalled
+        # request. The interpreter still joins the worker threads at exit, so
+        # the CLI only finishes once running requests complete or hit their
+        # own timeouts.
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    if cache is not None:
+        for company in to_fetch:
+            result = results_by_ticker[company]
+            if result['timestamp'] is not None:
+                cache.set(company.strip().upper(), result)
+        cache.set_failures(CIRCUIT.state())
+    
+    results = [results_by_ticker[company] for company in company_list]
     
     # Create dataframe
-    df = pd.DataFrame(results)
-    
-    # If no data or no datetime column, return empty dataframe
-    if df.empty or 'datetime' not in df.columns:
-        print("Warning: No earnings dates found for any of the companies")
-        return pd.DataFrame(columns=['ticker', 'company', 'date', 'time', 'datetime'])
-    
-    # Remove rows with no datetime for sorting
-    df_with_dates = df.dropna(subset=['datetime'])
-    df_without_dates = df[df['datetime'].isna()]
-    
-    # Sort rows with dates
-    if not df_with_dates.empty:
-        df_sorted_dates = df_with_dates.sort_values(
-            by=['datetime'], 
-            ascending=[True]
-        )
-        # Combine sorted dates with rows without dates
-        df_sorted = pd.concat([df_sorted_dates, df_without_dates])
-    else:
-        df_sorted = df
+    df = pd.DataFrame(results, columns=['ticker', 'company', 'timestamp', 'report_time'])
+    
+    # If no data, return empty dataframe
+    if df.empty:
+        logger.warning("Warning: No earnings dates found for any of the companies")
+        return pd.DataFrame(columns=['ticker', 'company', 'date_iso', 'date', 'time', 'datetime'])
     
-    return df_sorted
+    # Format all dates in one go
+    df = format_dates(df)
+    
+    # Sort by date, then by time for rows that have one, keeping date-only
+    # rows after them on their day and companies without a date at the end
+    return df.sort_values(by=['date_iso', 'datetime'], na_position='last', kind='mergesort')
 
 def format_output(df: pd.DataFrame) -> str:
     """
@@ -250,51 +813,31 @@ def format_output(df: pd.DataFrame) -> str:
     if df.empty:
         return "No earnings data found for the requested companies."
     
-    # Copy the dataframe for display
-    display_df = df.copy()
-    
-    # Drop the datetime column if it exists
-    if 'datetime' in display_df.columns:
-        display_df = display_df.drop('datetime', axis=1)
-    
-    # For companies with no earnings date, mark as "No date available"
-    display_df['date'] = display_df['date'].fillna("No date available")
-    display_df['time'] = display_df['time'].fillna("--")
-    
     # Add header indicating Eastern Time
     header = "Earnings Dates (Eastern Time):"
     
     # Group by date_iso (for sorting) but display the word format
     current_date_iso = None
-    current_date_words = None
     lines = [header]
     no_date_lines = []
     
-    # Sort the dataframe by date_iso if it exists
-    if 'date_iso' in display_df.columns:
-        df_with_dates = display_df.dropna(subset=['date_iso'])
-        df_without_dates = display_df[display_df['date_iso'].isna()]
+    # Sort by date_iso, keeping the order within each day and companies
+    # without a date at the end
+    display_df = df.sort_values(by='date_iso', na_position='last', kind='mergesort')
+    
+    rows = display_df[['ticker', 'company', 'date', 'time', 'date_iso']].itertuples(index=False, name=None)
+    for ticker, company, date_words, time_str, date_iso in rows:
+        company_info = f"  {ticker} ({company})"
+        if not pd.isna(time_str):
+            company_info += f" - {time_str}"
         
-        # Sort by date_iso
-        if not df_with_dates.empty:
-            df_with_dates = df_with_dates.sort_values(by='date_iso')
-            
-        # Recombine
-        display_df = pd.concat([df_with_dates, df_without_dates])
-    
-    for _, row in display_df.iterrows():
-        company_info = f"  {row['ticker']} ({row['company']})"
-        if row['time'] != "--":
-            company_info += f" - {row['time']}"
-            
-        if row['date'] == "No date available":
+        # Companies with no earnings date are listed separately at the end
+        if pd.isna(date_words):
             no_date_lines.append(company_info)
         else:
-            date_iso = row.get('date_iso', None)
             if date_iso != current_date_iso:
                 current_date_iso = date_iso
-                current_date_words = row['date']
-                lines.append(f"\n\033[1m{current_date_words} ({current_date_iso})\033[0m")
+                lines.append(f"\n\033[1m{date_words} ({date_iso})\033[0m")
             lines.append(company_info)
     
     # Add companies with no date at the end
@@ -307,6 +850,30 @@ def format_output(df: pd.DataFrame) -> str:
     
     return "\n".join(lines)
 
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Send progress messages to stdout through a queue.
+    
+    Worker threads only put records on the queue, so they never contend for
+    stdout; a single listener thread does the writing.
+    
+    Args:
+        level: Minimum level of messages to show
+    
+    Returns:
+        The started listener; stop it to flush any queued messages
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
 def save_to_csv(df: pd.DataFrame, output_file: str) -> None:
     """
     Save the results to a CSV file.
@@ -317,16 +884,11 @@ def save_to_csv(df: pd.DataFrame, output_file: str) -> None:
     """
     if df.empty:
         # Create empty dataframe with required columns
-        save_df = pd.DataFrame(columns=['ticker', 'company', 'date_iso', 'date', 'time'])
-    else:
-        # Create a copy
-        save_df = df.copy()
-        
-        # Drop the datetime column if it exists
-        if 'datetime' in save_df.columns:
-            save_df = save_df.drop('datetime', axis=1)
+        df = pd.DataFrame(columns=['ticker', 'company', 'date_iso', 'date', 'time'])
     
-    save_df.to_csv(output_file, index=False)
+    # Write every column except datetime straight from the frame, no copy needed
+    columns = [column for column in df.columns if column != 'datetime']
+    df.to_csv(output_file, index=False, columns=columns)
     print(f"Results saved to {output_file}")
 
 def main():
@@ -337,8 +899,17 @@ def main():
     group.add_argument('-f', '--file', help='File containing ticker symbols (one per line)')
     
     parser.add_argument('-o', '--output', help='Output CSV file', default='earnings_dates.csv')
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Number of tickers to fetch concurrently (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore earnings dates cached by previous runs')
+    parser.add_argument('-b', '--backend', choices=['yahoo', 'fmp'],
+                        help='Data source to try first (default: fmp for more than '
+                             f'{FMP_THRESHOLD} tickers when FMP_API_KEY is set, otherwise yahoo)')
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
     
     if args.tickers:
         companies = [ticker.strip() for ticker in args.tickers.split(',')]
@@ -346,10 +917,26 @@ def main():
         with open(args.file, 'r') as f:
             companies = [line.strip() for line in f if line.strip()]
     
+    fmp_api_key = os.environ.get('FMP_API_KEY')
+    backend = args.backend
+    if backend is None:
+        backend = 'fmp' if fmp_api_key and len(companies) > FMP_THRESHOLD else 'yahoo'
+    elif backend == 'fmp' and not fmp_api_key:
+        parser.error('the fmp backend needs an API key in the FMP_API_KEY environment variable')
+    
     print("All times will be displayed in Eastern Time (ET)")
     
     # Get and process the earnings dates
-    results_df = process_companies(companies)
+    listener = setup_logging()
+    cache = None if args.no_cache else EarningsCache()
+    try:
+        results_df = process_companies(companies, max_workers=args.workers, cache=cache,
+                                       backend=backend, fmp_api_key=fmp_api_key)
+    finally:
+        if cache is not None:
+            cache.close()
+        # Flush progress messages before printing the results
+        listener.stop()
     
     # Display the results
     formatted_output = format_output(results_df)